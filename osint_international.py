@@ -6,19 +6,79 @@ For non-US focused OSINT operations
 
 import sqlite3
 import re
+import sys
 import json
+import functools
 import requests
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from itertools import groupby, repeat
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional
 from urllib.parse import quote, urlparse
-import phonenumbers
-from phonenumbers import geocoder, carrier, timezone
-import whois
-import dns.resolver
-import dns.reversename
 import hashlib
 import base64
+import socket
+import threading
+import time
+
+# Cache getaddrinfo so fresh connections during a sweep skip repeated
+# blocking DNS lookups; entries live for the (short) process lifetime
+_getaddrinfo = socket.getaddrinfo
+
+@functools.lru_cache(maxsize=1024)
+def _cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    return _getaddrinfo(host, port, family, type, proto, flags)
+
+socket.getaddrinfo = _cached_getaddrinfo
+
+# The heavyweight lookup libraries (phonenumbers metadata tables,
+# whois, dnspython) are imported lazily so starting the tool or using a
+# single module doesn't pay for all of them
+
+@functools.lru_cache(maxsize=None)
+def _phone_modules():
+    import phonenumbers
+    from phonenumbers import geocoder, carrier, timezone
+    return phonenumbers, geocoder, carrier, timezone
+
+@functools.lru_cache(maxsize=None)
+def _resolver():
+    """Shared resolver with an answer cache so repeated domain lookups
+    skip the network round-trip"""
+    import dns.resolver
+    resolver = dns.resolver.Resolver()
+    resolver.cache = dns.resolver.LRUCache(1000)
+    return resolver
+
+# v2/v3 .onion URLs, compiled once for the dark web result scan
+_ONION_RE = re.compile(r'https?://[a-z2-7]{16,56}\.onion[^\s<>"]*')
+
+# Lets sqlite3.Row pass straight into the serializer without an
+# intermediate dict(row) copy per exported row
+def _json_default(obj):
+    if isinstance(obj, sqlite3.Row):
+        return {k: obj[k] for k in obj.keys()}
+    return str(obj)
+
+# orjson serializes several times faster than stdlib json; fall back
+# silently when it is not installed
+try:
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj, default=_json_default).decode()
+
+    def _json_dumps_pretty(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=_json_default).decode()
+
+except ImportError:
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, default=_json_default)
+
+    def _json_dumps_pretty(obj) -> str:
+        return json.dumps(obj, indent=2, default=_json_default)
 
 # Colors
 class Colors:
@@ -32,16 +92,161 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
+# Skip ANSI emission entirely when output is piped or logged, and
+# switch stdout from line to block buffering so scripted runs don't
+# flush on every print; input() still flushes before each prompt
+if not sys.stdout.isatty():
+    for _attr in ('HEADER', 'BLUE', 'CYAN', 'GREEN', 'YELLOW', 'RED', 'END', 'BOLD', 'UNDERLINE'):
+        setattr(Colors, _attr, '')
+    try:
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    except (AttributeError, ValueError):
+        pass
+
+# Common status prefixes, formatted once instead of per print call
+_PREFIX_OK = f"{Colors.GREEN}[+]{Colors.END}"
+_PREFIX_FAIL = f"{Colors.RED}[-]{Colors.END}"
+_PREFIX_INFO = f"{Colors.CYAN}[*]{Colors.END}"
+
+# Static UI blocks rendered once at import; the menu loop writes each
+# as a single buffer instead of re-interpolating per iteration
+_BANNER_STR = f"""
+{Colors.BOLD}{Colors.CYAN}
+╔════════════════════════════════════════════╗
+║   INTERNATIONAL OSINT TOOL v2.0            ║
+║   Advanced Intelligence Gathering          ║
+║   Multi-Source OSINT Platform              ║
+╚════════════════════════════════════════════╝
+{Colors.END}
+"""
+
+_MAIN_MENU_STR = f"""
+{Colors.BOLD}Main Menu:{Colors.END}
+
+{Colors.CYAN}  Core Modules:{Colors.END}
+  {Colors.GREEN}1.{Colors.END} Phone Number Lookup
+  {Colors.GREEN}2.{Colors.END} Username/People Search
+  {Colors.GREEN}3.{Colors.END} Email Search
+
+{Colors.CYAN}  Advanced Modules:{Colors.END}
+  {Colors.GREEN}4.{Colors.END} Domain OSINT (WHOIS/DNS)
+  {Colors.GREEN}5.{Colors.END} Breach Data Check
+  {Colors.GREEN}6.{Colors.END} Reverse Image Search
+  {Colors.GREEN}7.{Colors.END} Dark Web Search
+
+{Colors.CYAN}  Utilities:{Colors.END}
+  {Colors.GREEN}8.{Colors.END} View Recent Searches
+  {Colors.GREEN}9.{Colors.END} Export Results
+  {Colors.GREEN}0.{Colors.END} Country Selection Guide
+  {Colors.GREEN}q.{Colors.END} Quit
+"""
+
+_COUNTRY_GUIDE = {
+    'Europe': {
+        'GB': 'United Kingdom (+44)',
+        'DE': 'Germany (+49)',
+        'FR': 'France (+33)',
+        'IT': 'Italy (+39)',
+        'ES': 'Spain (+34)',
+        'RU': 'Russia (+7)',
+        'PL': 'Poland (+48)',
+        'UA': 'Ukraine (+380)',
+    },
+    'Asia': {
+        'CN': 'China (+86)',
+        'IN': 'India (+91)',
+        'JP': 'Japan (+81)',
+        'KR': 'South Korea (+82)',
+        'PK': 'Pakistan (+92)',
+        'ID': 'Indonesia (+62)',
+        'TH': 'Thailand (+66)',
+        'VN': 'Vietnam (+84)',
+    },
+    'Americas': {
+        'BR': 'Brazil (+55)',
+        'MX': 'Mexico (+52)',
+        'AR': 'Argentina (+54)',
+        'CO': 'Colombia (+57)',
+        'CA': 'Canada (+1)',
+    },
+    'Other': {
+        'AU': 'Australia (+61)',
+        'ZA': 'South Africa (+27)',
+        'EG': 'Egypt (+20)',
+        'SA': 'Saudi Arabia (+966)',
+    }
+}
+
+_COUNTRY_GUIDE_STR = ''.join(
+    [f"\n{Colors.BOLD}Country Selection Guide{Colors.END}\n\n"] + [
+        f"{Colors.CYAN}{region}:{Colors.END}\n"
+        + ''.join(f"  {Colors.GREEN}{code}{Colors.END} - {name}\n"
+                  for code, name in codes.items())
+        + "\n"
+        for region, codes in _COUNTRY_GUIDE.items()
+    ]
+)
+
+# Line-type names keyed on the phonenumbers type constants, built once
+# on first phone lookup
+@functools.lru_cache(maxsize=None)
+def _line_type_map():
+    phonenumbers = _phone_modules()[0]
+    return {
+        phonenumbers.PhoneNumberType.FIXED_LINE: 'Fixed Line',
+        phonenumbers.PhoneNumberType.MOBILE: 'Mobile',
+        phonenumbers.PhoneNumberType.FIXED_LINE_OR_MOBILE: 'Fixed Line or Mobile',
+        phonenumbers.PhoneNumberType.TOLL_FREE: 'Toll Free',
+        phonenumbers.PhoneNumberType.PREMIUM_RATE: 'Premium Rate',
+        phonenumbers.PhoneNumberType.SHARED_COST: 'Shared Cost',
+        phonenumbers.PhoneNumberType.VOIP: 'VoIP',
+        phonenumbers.PhoneNumberType.PERSONAL_NUMBER: 'Personal Number',
+        phonenumbers.PhoneNumberType.PAGER: 'Pager',
+        phonenumbers.PhoneNumberType.UAN: 'UAN',
+        phonenumbers.PhoneNumberType.VOICEMAIL: 'Voicemail',
+        phonenumbers.PhoneNumberType.UNKNOWN: 'Unknown',
+    }
+
 # Database
 DB_PATH = Path.home() / '.osint_international.db'
 RESULTS_DIR = Path.home() / 'osint_results'
 RESULTS_DIR.mkdir(exist_ok=True)
 
+# Hot INSERT statements as module constants so repeated saves reuse the
+# same string identity and hit sqlite3's prepared-statement cache
+_INSERT_PHONE_SQL = """
+    INSERT INTO phone_lookups
+    (phone_number, country, carrier, line_type, location, timezone, valid, raw_data)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_PEOPLE_SQL = """
+    INSERT INTO people_searches
+    (username, platform, url, found, additional_info)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
 class OSINTDatabase:
     def __init__(self):
-        self.conn = sqlite3.connect(DB_PATH)
+        # The response cache is read/written from sweep worker threads;
+        # the lock serializes access to the shared connection
+        self.conn = sqlite3.connect(DB_PATH, cached_statements=512, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        # Bumped on every search insert so cached renderings of history
+        # views know when they are stale
+        self.version = 0
+        # WAL amortizes fsync cost across a transaction instead of paying
+        # it per statement; NORMAL sync is safe with WAL
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        # 64 MB page cache, in-memory temp tables and a 256 MB mmap window
+        # keep the many small reads/writes off the disk
+        self.conn.execute("PRAGMA cache_size=-65536")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA mmap_size=268435456")
         self.create_tables()
+        self.evict_expired_cache()
 
     def create_tables(self):
         cursor = self.conn.cursor()
@@ -127,6 +332,33 @@ class OSINTDatabase:
             )
         """)
 
+        # Cached HTTP probe responses with a TTL
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS cached_requests (
+                url TEXT PRIMARY KEY,
+                status INTEGER,
+                body TEXT,
+                expires_at INTEGER
+            )
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_cache_expires
+            ON cached_requests(expires_at)
+        """)
+
+        # Cached WHOIS payloads with a TTL
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS whois_cache (
+                domain TEXT PRIMARY KEY,
+                payload TEXT,
+                expires_at INTEGER
+            )
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_whois_expires
+            ON whois_cache(expires_at)
+        """)
+
         # Dark web searches
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS darkweb_searches (
@@ -139,15 +371,41 @@ class OSINTDatabase:
             )
         """)
 
+        # Indexes for the export/report queries, which filter on username
+        # and sort every table by created_at
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_people_username_found
+            ON people_searches(username, found)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_people_created
+            ON people_searches(created_at DESC)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_phone_created
+            ON phone_lookups(created_at DESC)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_sessions_created
+            ON search_sessions(created_at DESC)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_phone_number
+            ON phone_lookups(phone_number)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_breach_email
+            ON breach_searches(email)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_domain_domain
+            ON domain_lookups(domain)
+        """)
+
         self.conn.commit()
 
     def save_phone_lookup(self, data: Dict):
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO phone_lookups
-            (phone_number, country, carrier, line_type, location, timezone, valid, raw_data)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        cursor = self.conn.execute(_INSERT_PHONE_SQL, (
             data.get('phone_number'),
             data.get('country'),
             data.get('carrier'),
@@ -155,19 +413,82 @@ class OSINTDatabase:
             data.get('location'),
             data.get('timezone'),
             data.get('valid'),
-            json.dumps(data.get('raw_data', {}))
+            _json_dumps(data.get('raw_data', {}))
         ))
         self.conn.commit()
+        self.version += 1
         return cursor.lastrowid
 
+    def save_phone_lookup_batch(self, lookups: List[Dict]):
+        """Save many phone lookups in one transaction"""
+        with self.conn:
+            self.conn.executemany(_INSERT_PHONE_SQL, [
+                (
+                    data.get('phone_number'),
+                    data.get('country'),
+                    data.get('carrier'),
+                    data.get('line_type'),
+                    data.get('location'),
+                    data.get('timezone'),
+                    data.get('valid'),
+                    _json_dumps(data.get('raw_data', {}))
+                )
+                for data in lookups
+            ])
+        self.version += 1
+
     def save_username_search(self, username: str, platform: str, url: str, found: bool, info: str = ""):
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO people_searches
-            (username, platform, url, found, additional_info)
-            VALUES (?, ?, ?, ?, ?)
-        """, (username, platform, url, found, info))
+        self.conn.execute(_INSERT_PEOPLE_SQL, (username, platform, url, found, info))
         self.conn.commit()
+        self.version += 1
+
+    def save_username_search_batch(self, rows: List[tuple]):
+        """Save many username search results in one transaction"""
+        with self.conn:
+            self.conn.executemany(_INSERT_PEOPLE_SQL, rows)
+        self.version += 1
+
+    def get_cached_response(self, url: str):
+        """Return (status, body) for a cached, unexpired URL, else None"""
+        with self._lock:
+            row = self.conn.execute("""
+                SELECT status, body FROM cached_requests
+                WHERE url = ? AND expires_at > ?
+            """, (url, int(time.time()))).fetchone()
+        return (row['status'], row['body']) if row else None
+
+    def store_cached_response(self, url: str, status: int, body: str, ttl: int):
+        with self._lock, self.conn:
+            self.conn.execute("""
+                INSERT OR REPLACE INTO cached_requests (url, status, body, expires_at)
+                VALUES (?, ?, ?, ?)
+            """, (url, status, body, int(time.time()) + ttl))
+
+    def get_cached_whois(self, domain: str) -> Optional[Dict]:
+        """Return the cached WHOIS payload for a domain, or None"""
+        with self._lock:
+            row = self.conn.execute("""
+                SELECT payload FROM whois_cache
+                WHERE domain = ? AND expires_at > ?
+            """, (domain, int(time.time()))).fetchone()
+        return json.loads(row['payload']) if row else None
+
+    def store_cached_whois(self, domain: str, payload: Dict, ttl: int = 86400):
+        with self._lock, self.conn:
+            self.conn.execute("""
+                INSERT OR REPLACE INTO whois_cache (domain, payload, expires_at)
+                VALUES (?, ?, ?)
+            """, (domain, _json_dumps(payload), int(time.time()) + ttl))
+
+    def evict_expired_cache(self):
+        """Drop expired response-cache rows (O(log n) via the index)"""
+        with self._lock, self.conn:
+            self.conn.execute(
+                "DELETE FROM cached_requests WHERE expires_at <= ?", (int(time.time()),)
+            )
+            self.conn.execute(
+                "DELETE FROM whois_cache WHERE expires_at <= ?", (int(time.time()),)
+            )
 
     def get_recent_searches(self, limit: int = 10):
         cursor = self.conn.cursor()
@@ -177,11 +498,96 @@ class OSINTDatabase:
         """, (limit,))
         return [dict(row) for row in cursor.fetchall()]
 
+def _plausible_phone(phone_number: str) -> bool:
+    """
+    Cheap digit-count sanity check so batch runs skip the full
+    phonenumbers parse for obviously invalid input (E.164 numbers have
+    at most 15 digits; allow slack for 00-prefixed input)
+    """
+    digits = sum(ch.isdigit() for ch in phone_number)
+    return 4 <= digits <= 17
+
+@functools.lru_cache(maxsize=4096)
+def _parse_phone(phone_number: str, default_country: Optional[str]):
+    """Parse a phone number, caching results for repeated batch inputs"""
+    return _phone_modules()[0].parse(phone_number, default_country)
+
+def _analyze_phone(phone_number: str, default_country: str = None) -> Dict:
+    """
+    Parse and analyze a phone number (pure computation, no printing or
+    database access, so it can run in worker processes)
+    """
+    results = {
+        'phone_number': phone_number,
+        'valid': False,
+        'country': None,
+        'carrier': None,
+        'line_type': None,
+        'location': None,
+        'timezone': None,
+        'raw_data': {}
+    }
+
+    if not _plausible_phone(phone_number):
+        results['raw_data']['error'] = 'Implausible digit count for a phone number'
+        return results
+
+    phonenumbers, geocoder, carrier, timezone = _phone_modules()
+
+    try:
+        # Parse phone number
+        parsed = _parse_phone(phone_number, default_country or None)
+
+        # Validate
+        is_valid = phonenumbers.is_valid_number(parsed)
+        results['valid'] = is_valid
+
+        if is_valid:
+            # Get country/location (one trie walk; used for both fields)
+            country = geocoder.description_for_number(parsed, "en")
+            results['country'] = country
+            results['location'] = country
+
+            # Get carrier
+            results['carrier'] = carrier.name_for_number(parsed, "en")
+
+            # Get line type
+            number_type = phonenumbers.number_type(parsed)
+            results['line_type'] = _line_type_map().get(number_type, 'Unknown')
+
+            # Get timezone
+            timezones = timezone.time_zones_for_number(parsed)
+            results['timezone'] = ', '.join(timezones) if timezones else 'Unknown'
+
+            # Format international and national
+            international_format = phonenumbers.format_number(
+                parsed, phonenumbers.PhoneNumberFormat.INTERNATIONAL
+            )
+            national_format = phonenumbers.format_number(
+                parsed, phonenumbers.PhoneNumberFormat.NATIONAL
+            )
+
+            results['raw_data'] = {
+                'international_format': international_format,
+                'national_format': national_format,
+                'country_code': parsed.country_code,
+                'national_number': parsed.national_number
+            }
+
+    except phonenumbers.NumberParseException as e:
+        results['raw_data']['error'] = str(e)
+
+    return results
+
 class PhoneOSINT:
     """International phone number OSINT"""
 
     def __init__(self, db: OSINTDatabase):
         self.db = db
+        # Analysis results for numbers already looked up this session;
+        # re-entering one replays the answer without re-running the
+        # carrier/geocoder/timezone work
+        self._lookup_cache: Dict = {}
 
     def lookup_phone(self, phone_number: str, default_country: str = None) -> Dict:
         """
@@ -190,92 +596,26 @@ class PhoneOSINT:
         """
         print(f"\n{Colors.CYAN}[*] Analyzing phone number: {phone_number}{Colors.END}")
 
-        results = {
-            'phone_number': phone_number,
-            'valid': False,
-            'country': None,
-            'carrier': None,
-            'line_type': None,
-            'location': None,
-            'timezone': None,
-            'raw_data': {}
-        }
-
-        try:
-            # Parse phone number
-            if default_country:
-                parsed = phonenumbers.parse(phone_number, default_country)
-            else:
-                parsed = phonenumbers.parse(phone_number, None)
-
-            # Validate
-            is_valid = phonenumbers.is_valid_number(parsed)
-            results['valid'] = is_valid
-
-            if is_valid:
-                # Get country
-                country = geocoder.description_for_number(parsed, "en")
-                results['country'] = country
-
-                # Get carrier
-                carrier_name = carrier.name_for_number(parsed, "en")
-                results['carrier'] = carrier_name
-
-                # Get line type
-                number_type = phonenumbers.number_type(parsed)
-                type_map = {
-                    0: 'Fixed Line',
-                    1: 'Mobile',
-                    2: 'Fixed Line or Mobile',
-                    3: 'Toll Free',
-                    4: 'Premium Rate',
-                    5: 'Shared Cost',
-                    6: 'VoIP',
-                    7: 'Personal Number',
-                    8: 'Pager',
-                    9: 'UAN',
-                    10: 'Voicemail',
-                    99: 'Unknown'
-                }
-                results['line_type'] = type_map.get(number_type, 'Unknown')
-
-                # Get location
-                results['location'] = geocoder.description_for_number(parsed, "en")
-
-                # Get timezone
-                timezones = timezone.time_zones_for_number(parsed)
-                results['timezone'] = ', '.join(timezones) if timezones else 'Unknown'
-
-                # Format international and national
-                international_format = phonenumbers.format_number(
-                    parsed, phonenumbers.PhoneNumberFormat.INTERNATIONAL
-                )
-                national_format = phonenumbers.format_number(
-                    parsed, phonenumbers.PhoneNumberFormat.NATIONAL
-                )
-
-                results['raw_data'] = {
-                    'international_format': international_format,
-                    'national_format': national_format,
-                    'country_code': parsed.country_code,
-                    'national_number': parsed.national_number
-                }
-
-                print(f"{Colors.GREEN}[+] Valid number!{Colors.END}")
-                print(f"{Colors.BLUE}Country:{Colors.END} {country}")
-                print(f"{Colors.BLUE}Carrier:{Colors.END} {carrier_name or 'Unknown'}")
-                print(f"{Colors.BLUE}Line Type:{Colors.END} {results['line_type']}")
-                print(f"{Colors.BLUE}Location:{Colors.END} {results['location']}")
-                print(f"{Colors.BLUE}Timezone:{Colors.END} {results['timezone']}")
-                print(f"{Colors.BLUE}International Format:{Colors.END} {international_format}")
-                print(f"{Colors.BLUE}National Format:{Colors.END} {national_format}")
-
-            else:
-                print(f"{Colors.RED}[-] Invalid phone number{Colors.END}")
-
-        except phonenumbers.NumberParseException as e:
-            print(f"{Colors.RED}[-] Error parsing number: {e}{Colors.END}")
-            results['raw_data']['error'] = str(e)
+        cache_key = (phone_number.strip(), default_country or '')
+        results = self._lookup_cache.get(cache_key)
+        if results is None:
+            results = _analyze_phone(phone_number, default_country)
+            self._lookup_cache[cache_key] = results
+
+        if results['valid']:
+            raw = results['raw_data']
+            print(f"{Colors.GREEN}[+] Valid number!{Colors.END}")
+            print(f"{Colors.BLUE}Country:{Colors.END} {results['country']}")
+            print(f"{Colors.BLUE}Carrier:{Colors.END} {results['carrier'] or 'Unknown'}")
+            print(f"{Colors.BLUE}Line Type:{Colors.END} {results['line_type']}")
+            print(f"{Colors.BLUE}Location:{Colors.END} {results['location']}")
+            print(f"{Colors.BLUE}Timezone:{Colors.END} {results['timezone']}")
+            print(f"{Colors.BLUE}International Format:{Colors.END} {raw['international_format']}")
+            print(f"{Colors.BLUE}National Format:{Colors.END} {raw['national_format']}")
+        elif 'error' in results['raw_data']:
+            print(f"{Colors.RED}[-] Error parsing number: {results['raw_data']['error']}{Colors.END}")
+        else:
+            print(f"{Colors.RED}[-] Invalid phone number{Colors.END}")
 
         # Save to database
         self.db.save_phone_lookup(results)
@@ -283,11 +623,22 @@ class PhoneOSINT:
         return results
 
     def batch_lookup(self, phone_numbers: List[str], country: str = None):
-        """Lookup multiple phone numbers"""
-        results = []
-        for phone in phone_numbers:
-            result = self.lookup_phone(phone.strip(), country)
-            results.append(result)
+        """Lookup multiple phone numbers in parallel across CPU cores"""
+        numbers = [phone.strip() for phone in phone_numbers]
+
+        # The phonenumbers work is CPU-bound and per-number independent;
+        # fan it out over processes and keep DB writes in the parent
+        with ProcessPoolExecutor() as pool:
+            results = list(pool.map(_analyze_phone, numbers, repeat(country), chunksize=64))
+
+        for result in results:
+            prefix = _PREFIX_OK if result['valid'] else _PREFIX_FAIL
+            status = f"{Colors.GREEN}valid{Colors.END}" if result['valid'] else f"{Colors.RED}invalid{Colors.END}"
+            print(f"{prefix} {Colors.BLUE}{result['phone_number']}:{Colors.END} {status}"
+                  f" ({result['country'] or 'unknown country'})")
+
+        self.db.save_phone_lookup_batch(results)
+
         return results
 
 class PeopleOSINT:
@@ -324,7 +675,6 @@ class PeopleOSINT:
         'SoundCloud': 'https://soundcloud.com/{}',
         'Spotify': 'https://open.spotify.com/user/{}',
         'Steam': 'https://steamcommunity.com/id/{}',
-        'Telegram': 'https://t.me/{}',
         'TikTok': 'https://www.tiktok.com/@{}',
         'Twitch': 'https://www.twitch.tv/{}',
         'Twitter': 'https://twitter.com/{}',
@@ -336,67 +686,140 @@ class PeopleOSINT:
         'WordPress': 'https://{}.wordpress.com',
     }
 
+    # Platforms that can actually be probed by URL, precomputed so the
+    # default sweep skips the None entries entirely
+    ACTIVE_PLATFORMS = tuple(
+        (name, template) for name, template in PLATFORMS.items() if template is not None
+    )
+
     def __init__(self, db: OSINTDatabase):
         self.db = db
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
+        # Size the connection pool for the concurrent sweep so parallel
+        # probes reuse keep-alive connections instead of re-handshaking
+        # TLS, and retry transient failures once with a short backoff
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=64,
+            pool_maxsize=64,
+            max_retries=Retry(total=1, backoff_factor=0.1),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # Probe results keyed by (username, platform); investigation
+        # workflows repeat the same username often
+        self._probe_cache = {}
+        # Resolve platform hosts in the background so the first sweep
+        # doesn't pay DNS latency; answers land in the getaddrinfo cache
+        threading.Thread(target=self._prewarm_dns, daemon=True).start()
+
+    def _prewarm_dns(self):
+        hosts = set()
+        for _, template in self.ACTIVE_PLATFORMS:
+            host = urlparse(template).hostname
+            # Skip templates where the username forms the subdomain
+            if host and '{' not in host:
+                hosts.add(host)
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            for host in hosts:
+                executor.submit(self._resolve_quiet, host)
+
+    @staticmethod
+    def _resolve_quiet(host: str):
+        try:
+            socket.getaddrinfo(host, 443)
+        except OSError:
+            pass
+
+    # Platforms whose 200 responses need body inspection to weed out soft
+    # "not found" pages; the rest are trusted on status code alone
+    NEEDS_BODY = {
+        'VK', 'OK', 'Telegram', 'Weibo', 'Baidu', 'Skype', 'Instagram',
+        'Twitter', 'Reddit', 'TikTok', 'Snapchat', 'Spotify', 'Steam',
+        'Tumblr', 'WordPress',
+    }
+
+    # How much of the body to inspect for "not found" indicators; they all
+    # appear near the top of the page
+    BODY_READ_LIMIT = 32768
+
+    # How long persisted probe responses stay valid
+    PROBE_CACHE_TTL = 3600
+
+    # Common "not found" indicators, compiled once into a single
+    # case-insensitive alternation so each body is scanned in one pass
+    NOT_FOUND_RE = re.compile(
+        r"page not found"
+        r"|user not found"
+        r"|profile not found"
+        r"|account not found"
+        r"|doesn't exist"
+        r"|not available"
+        r"|sorry, this page isn't available"
+        r"|the page you requested was not found",
+        re.IGNORECASE
+    )
+
+    # Platform-specific "not found" signatures; platforms without an entry
+    # fall back to the generic NOT_FOUND_RE
+    NOT_FOUND_PATTERNS = {
+        'Instagram': r"sorry, this page isn't available",
+        'Twitter': r"this account doesn't exist",
+        'Reddit': r"nobody on reddit goes by that name",
+        'Steam': r"the specified profile could not be found",
+        'TikTok': r"couldn't find this account",
+    }
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _compile_not_found(pattern: str):
+        return re.compile(pattern, re.IGNORECASE)
 
     def check_username(self, username: str, platform: str, url_template: str) -> Dict:
         """Check if username exists on platform"""
         if not url_template:
             return {'platform': platform, 'found': False, 'url': None, 'reason': 'No URL check available'}
 
+        cache_key = (username, platform)
+        cached = self._probe_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
         # Sanitize username for URL safety
         safe_username = quote(username, safe='')
         url = url_template.format(safe_username)
 
         try:
-            response = self.session.get(url, timeout=5, allow_redirects=True)
-
-            # Platform-specific detection
-            found = False
-            reason = ""
-
-            if response.status_code == 200:
-                # Additional checks for false positives
-                text_lower = response.text.lower()
-
-                # Common "not found" indicators
-                not_found_indicators = [
-                    'page not found',
-                    'user not found',
-                    'profile not found',
-                    'account not found',
-                    'doesn\'t exist',
-                    'not available',
-                    'sorry, this page isn\'t available',
-                    'the page you requested was not found'
-                ]
-
-                if any(indicator in text_lower for indicator in not_found_indicators):
-                    found = False
-                    reason = "Profile page indicates user not found"
-                else:
-                    found = True
-                    reason = f"HTTP {response.status_code} - Likely exists"
-
-            elif response.status_code == 404:
-                found = False
-                reason = "HTTP 404 - Not found"
-
+            # Layer two of caching: unexpired probe responses persisted in
+            # SQLite survive across runs
+            cached_response = self.db.get_cached_response(url)
+            if cached_response is not None:
+                status_code, body = cached_response
             else:
-                found = False
-                reason = f"HTTP {response.status_code}"
+                status_code, body = self._fetch_probe(platform, url)
+                # Only conclusive statuses are worth remembering; a
+                # rate-limit or bot-block (403/429/5xx) must not pin a
+                # "not found" verdict until the TTL runs out
+                if status_code in (200, 206, 404):
+                    self.db.store_cached_response(url, status_code, body, self.PROBE_CACHE_TTL)
 
-            return {
+            found, reason = self._classify_response(platform, status_code, body)
+
+            result = {
                 'platform': platform,
                 'found': found,
                 'url': url,
-                'status_code': response.status_code,
+                'status_code': status_code,
                 'reason': reason
             }
+            # Network errors and inconclusive statuses are not cached so
+            # a retry probes again
+            if status_code in (200, 206, 404):
+                self._probe_cache[cache_key] = dict(result)
+            return result
 
         except requests.RequestException as e:
             return {
@@ -406,39 +829,104 @@ class PeopleOSINT:
                 'reason': f"Error: {str(e)}"
             }
 
+    def _fetch_probe(self, platform: str, url: str) -> tuple:
+        """Fetch the minimum needed to classify a profile URL"""
+        # HEAD first: enough to classify by status code without pulling
+        # hundreds of KB of profile HTML
+        response = self.session.head(url, timeout=5, allow_redirects=True)
+        status_code = response.status_code
+
+        if status_code == 404 or (status_code == 200 and platform not in self.NEEDS_BODY):
+            return status_code, ''
+
+        # Platform needs body inspection (or rejected HEAD); ask for just
+        # the indicator-bearing prefix and stream whatever comes back.
+        # Servers ignoring Range return 200 with the full body, of which
+        # only the first chunk is read
+        response = self.session.get(
+            url,
+            headers={'Range': f'bytes=0-{self.BODY_READ_LIMIT - 1}'},
+            stream=True,
+            timeout=5,
+            allow_redirects=True,
+        )
+        try:
+            body = ''
+            if response.status_code in (200, 206):
+                # decode_content strips the gzip/deflate transfer encoding;
+                # a raw read would hand the signature scan compressed bytes
+                raw = response.raw.read(self.BODY_READ_LIMIT, decode_content=True)
+                body = raw.decode('utf-8', 'ignore')
+            return response.status_code, body
+        finally:
+            response.close()
+
+    def _classify_response(self, platform: str, status_code: int, body: str) -> tuple:
+        """Classify a probe response as (found, reason)"""
+        if status_code in (200, 206):
+            if body:
+                pattern = self.NOT_FOUND_PATTERNS.get(platform)
+                not_found_re = self._compile_not_found(pattern) if pattern else self.NOT_FOUND_RE
+                if not_found_re.search(body):
+                    return False, "Profile page indicates user not found"
+            return True, f"HTTP {status_code} - Likely exists"
+
+        if status_code == 404:
+            return False, "HTTP 404 - Not found"
+
+        return False, f"HTTP {status_code}"
+
+    MAX_WORKERS = 20
+
     def search_username(self, username: str, platforms: List[str] = None):
-        """Search for username across multiple platforms"""
+        """Search for username across multiple platforms (concurrently)"""
         print(f"\n{Colors.CYAN}[*] Searching for username: {username}{Colors.END}\n")
 
         if platforms is None:
-            platforms = list(self.PLATFORMS.keys())
+            candidates = list(self.ACTIVE_PLATFORMS)
+        else:
+            requested = set(platforms)
+            candidates = [
+                (name, template) for name, template in self.ACTIVE_PLATFORMS
+                if name in requested
+            ]
+            for name in requested - {name for name, _ in candidates}:
+                if name in self.PLATFORMS:
+                    print(f"{Colors.YELLOW}[-] {name}: No URL check available{Colors.END}")
 
         results = []
         found_count = 0
 
-        for platform in platforms:
-            if platform not in self.PLATFORMS:
-                continue
-
-            url_template = self.PLATFORMS[platform]
-
-            if url_template is None:
-                print(f"{Colors.YELLOW}[-] {platform}: No URL check available{Colors.END}")
-                continue
+        # The probes are pure network I/O, so fan them out across a thread
+        # pool and handle printing/DB writes in the main thread as they finish
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(self.check_username, username, platform, url_template): platform
+                for platform, url_template in candidates
+            }
 
-            print(f"{Colors.BLUE}[*] Checking {platform}...{Colors.END}", end=' ')
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+
+                # One buffered write per platform keeps output whole even
+                # with many results completing back to back
+                if result['found']:
+                    found_count += 1
+                    sys.stdout.write(
+                        f"{_PREFIX_OK} {Colors.BLUE}{result['platform']}:{Colors.END} {Colors.GREEN}FOUND!{Colors.END}\n"
+                        f"    {Colors.CYAN}{result['url']}{Colors.END}\n"
+                    )
+                else:
+                    sys.stdout.write(
+                        f"{_PREFIX_FAIL} {Colors.BLUE}{result['platform']}:{Colors.END} {Colors.RED}Not found{Colors.END}\n"
+                    )
 
-            result = self.check_username(username, platform, url_template)
-            results.append(result)
-
-            if result['found']:
-                print(f"{Colors.GREEN}FOUND!{Colors.END}")
-                print(f"    {Colors.CYAN}{result['url']}{Colors.END}")
-                found_count += 1
-                self.db.save_username_search(username, platform, result['url'], True, result['reason'])
-            else:
-                print(f"{Colors.RED}Not found{Colors.END}")
-                self.db.save_username_search(username, platform, result.get('url', ''), False, result['reason'])
+        if results:
+            self.db.save_username_search_batch([
+                (username, r['platform'], r.get('url') or '', r['found'], r['reason'])
+                for r in results
+            ])
 
         print(f"\n{Colors.GREEN}[+] Found on {found_count}/{len(results)} platforms{Colors.END}")
         return results
@@ -458,6 +946,25 @@ class DomainOSINT:
     def __init__(self, db: OSINTDatabase):
         self.db = db
 
+    @staticmethod
+    def _query_whois(domain: str) -> Dict:
+        """Run the registry WHOIS query and normalize the fields we keep"""
+        import whois
+        w = whois.query(domain)
+
+        name_servers = w.name_servers if hasattr(w, 'name_servers') else None
+        return {
+            'registrar': w.registrar if hasattr(w, 'registrar') else None,
+            'creation_date': str(w.creation_date) if hasattr(w, 'creation_date') else None,
+            'expiration_date': str(w.expiration_date) if hasattr(w, 'expiration_date') else None,
+            'updated_date': str(w.updated_date) if hasattr(w, 'updated_date') else None,
+            'name_servers': sorted(name_servers) if name_servers else None,
+            'status': w.status if hasattr(w, 'status') else None,
+            'emails': w.emails if hasattr(w, 'emails') else None,
+            'org': w.org if hasattr(w, 'org') else None,
+            'country': w.country if hasattr(w, 'country') else None,
+        }
+
     def lookup_domain(self, domain: str) -> Dict:
         """Perform WHOIS and DNS lookup on domain"""
         print(f"\n{Colors.CYAN}[*] Analyzing domain: {domain}{Colors.END}\n")
@@ -469,22 +976,31 @@ class DomainOSINT:
             'success': False
         }
 
+        # WHOIS and the five DNS record queries are all independent
+        # round-trips, so they run side by side on the same pool; the
+        # results are still collected and printed in the usual order
+        record_types = ('A', 'AAAA', 'MX', 'NS', 'TXT')
+
+        # Registry WHOIS servers cost a fresh TCP round-trip every
+        # time; reuse a cached payload for a day when we have one
+        whois_data = self.db.get_cached_whois(domain)
+
+        with ThreadPoolExecutor(max_workers=len(record_types) + 1) as executor:
+            whois_future = None
+            if whois_data is None:
+                whois_future = executor.submit(self._query_whois, domain)
+            futures = {
+                rtype: executor.submit(_resolver().resolve, domain, rtype)
+                for rtype in record_types
+            }
+
         # WHOIS Lookup
         try:
             print(f"{Colors.BLUE}[*] Performing WHOIS lookup...{Colors.END}")
-            w = whois.query(domain)
-
-            whois_data = {
-                'registrar': w.registrar if hasattr(w, 'registrar') else None,
-                'creation_date': str(w.creation_date) if hasattr(w, 'creation_date') else None,
-                'expiration_date': str(w.expiration_date) if hasattr(w, 'expiration_date') else None,
-                'updated_date': str(w.updated_date) if hasattr(w, 'updated_date') else None,
-                'name_servers': w.name_servers if hasattr(w, 'name_servers') else None,
-                'status': w.status if hasattr(w, 'status') else None,
-                'emails': w.emails if hasattr(w, 'emails') else None,
-                'org': w.org if hasattr(w, 'org') else None,
-                'country': w.country if hasattr(w, 'country') else None,
-            }
+
+            if whois_future is not None:
+                whois_data = whois_future.result()
+                self.db.store_cached_whois(domain, whois_data)
 
             results['whois_data'] = whois_data
             results['success'] = True
@@ -506,47 +1022,23 @@ class DomainOSINT:
         # DNS Lookup
         try:
             print(f"\n{Colors.BLUE}[*] Performing DNS lookups...{Colors.END}")
-            dns_data = {}
 
-            # A Records
-            try:
-                answers = dns.resolver.resolve(domain, 'A')
-                dns_data['A'] = [str(rdata) for rdata in answers]
-                print(f"  {Colors.GREEN}A Records:{Colors.END} {', '.join(dns_data['A'])}")
-            except:
-                dns_data['A'] = []
-
-            # AAAA Records (IPv6)
-            try:
-                answers = dns.resolver.resolve(domain, 'AAAA')
-                dns_data['AAAA'] = [str(rdata) for rdata in answers]
-                print(f"  {Colors.GREEN}AAAA Records:{Colors.END} {', '.join(dns_data['AAAA'])}")
-            except:
-                dns_data['AAAA'] = []
-
-            # MX Records
-            try:
-                answers = dns.resolver.resolve(domain, 'MX')
-                dns_data['MX'] = [str(rdata.exchange) for rdata in answers]
-                print(f"  {Colors.GREEN}MX Records:{Colors.END} {', '.join(dns_data['MX'])}")
-            except:
-                dns_data['MX'] = []
-
-            # NS Records
-            try:
-                answers = dns.resolver.resolve(domain, 'NS')
-                dns_data['NS'] = [str(rdata) for rdata in answers]
-                print(f"  {Colors.GREEN}NS Records:{Colors.END} {', '.join(dns_data['NS'])}")
-            except:
-                dns_data['NS'] = []
-
-            # TXT Records
-            try:
-                answers = dns.resolver.resolve(domain, 'TXT')
-                dns_data['TXT'] = [str(rdata) for rdata in answers]
+            dns_data = {}
+            for rtype, future in futures.items():
+                try:
+                    answers = future.result()
+                    if rtype == 'MX':
+                        dns_data[rtype] = [str(rdata.exchange) for rdata in answers]
+                    else:
+                        dns_data[rtype] = [str(rdata) for rdata in answers]
+                except Exception:
+                    dns_data[rtype] = []
+
+            for rtype in ('A', 'AAAA', 'MX', 'NS'):
+                if dns_data[rtype]:
+                    print(f"  {Colors.GREEN}{rtype} Records:{Colors.END} {', '.join(dns_data[rtype])}")
+            if dns_data['TXT']:
                 print(f"  {Colors.GREEN}TXT Records:{Colors.END} Found {len(dns_data['TXT'])} records")
-            except:
-                dns_data['TXT'] = []
 
             results['dns_records'] = dns_data
 
@@ -571,17 +1063,24 @@ class DomainOSINT:
             data['whois_data'].get('registrar'),
             data['whois_data'].get('creation_date'),
             data['whois_data'].get('expiration_date'),
-            json.dumps(data['whois_data'].get('name_servers')),
-            json.dumps(data['dns_records']),
-            json.dumps(data)
+            _json_dumps(data['whois_data'].get('name_servers')),
+            _json_dumps(data['dns_records']),
+            _json_dumps(data)
         ))
         self.db.conn.commit()
+        self.db.version += 1
 
 class BreachDataOSINT:
     """Breach data checking using HaveIBeenPwned API"""
 
     HIBP_API_BASE = "https://haveibeenpwned.com/api/v3"
 
+    # HIBP's cheapest API tier allows roughly one lookup per 1.5 s
+    RATE_LIMIT_INTERVAL = 1.6
+
+    # Breach verdicts change slowly; cache them locally for a week
+    RESULT_CACHE_TTL = 7 * 86400
+
     def __init__(self, db: OSINTDatabase):
         self.db = db
         self.session = requests.Session()
@@ -618,10 +1117,20 @@ class BreachDataOSINT:
             url = f"{self.HIBP_API_BASE}/breachedaccount/{quote(email)}"
             headers = {'hibp-api-key': api_key}
 
-            response = self.session.get(url, headers=headers, timeout=10)
-
-            if response.status_code == 200:
-                breaches = response.json()
+            # Recent verdicts are cached locally so re-checking an email
+            # within the week costs neither a request nor rate budget
+            cached = self.db.get_cached_response(url)
+            if cached is not None:
+                status_code, body = cached
+            else:
+                response = self.session.get(url, headers=headers, timeout=10)
+                status_code = response.status_code
+                body = response.text if status_code == 200 else ''
+                if status_code in (200, 404):
+                    self.db.store_cached_response(url, status_code, body, self.RESULT_CACHE_TTL)
+
+            if status_code == 200:
+                breaches = json.loads(body)
                 results['breaches'] = breaches
                 results['breach_count'] = len(breaches)
                 results['found'] = True
@@ -636,11 +1145,11 @@ class BreachDataOSINT:
                 if len(breaches) > 10:
                     print(f"  {Colors.CYAN}... and {len(breaches) - 10} more{Colors.END}\n")
 
-            elif response.status_code == 404:
+            elif status_code == 404:
                 print(f"{Colors.GREEN}[+] Email not found in any breaches{Colors.END}")
                 results['found'] = False
             else:
-                print(f"{Colors.RED}[-] API returned status {response.status_code}{Colors.END}")
+                print(f"{Colors.RED}[-] API returned status {status_code}{Colors.END}")
 
         except Exception as e:
             print(f"{Colors.RED}[-] Error checking breaches: {e}{Colors.END}")
@@ -650,6 +1159,27 @@ class BreachDataOSINT:
 
         return results
 
+    def check_breaches_batch(self, emails: List[str], api_key: str = None) -> List[Dict]:
+        """
+        Check a list of emails, pacing live API calls to HIBP's rate
+        limit; locally cached verdicts don't spend rate budget
+        """
+        results = []
+        for email in emails:
+            email = email.strip()
+            if not email:
+                continue
+
+            url = f"{self.HIBP_API_BASE}/breachedaccount/{quote(email)}"
+            needs_request = api_key and self.db.get_cached_response(url) is None
+
+            if results and needs_request:
+                time.sleep(self.RATE_LIMIT_INTERVAL)
+
+            results.append(self.check_breaches(email, api_key))
+
+        return results
+
     def save_to_db(self, data: Dict):
         """Save breach check to database"""
         cursor = self.db.conn.cursor()
@@ -660,11 +1190,12 @@ class BreachDataOSINT:
         """, (
             data['email'],
             data['breach_count'],
-            json.dumps([b.get('Name') for b in data['breaches']]),
+            _json_dumps([b.get('Name') for b in data['breaches']]),
             data['paste_count'],
-            json.dumps(data)
+            _json_dumps(data)
         ))
         self.db.conn.commit()
+        self.db.version += 1
 
 class ReverseImageOSINT:
     """Reverse image search"""
@@ -673,10 +1204,15 @@ class ReverseImageOSINT:
         self.db = db
 
     def calculate_image_hash(self, image_path: str) -> str:
-        """Calculate hash of image file"""
+        """Calculate hash of image file, streaming instead of loading it whole"""
         try:
             with open(image_path, 'rb') as f:
-                return hashlib.sha256(f.read()).hexdigest()
+                if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+                    return hashlib.file_digest(f, 'sha256').hexdigest()
+                digest = hashlib.sha256()
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(chunk)
+                return digest.hexdigest()
         except Exception as e:
             return f"Error: {e}"
 
@@ -730,9 +1266,10 @@ class ReverseImageOSINT:
             data['image_hash'],
             'Manual',
             False,
-            json.dumps(data)
+            _json_dumps(data)
         ))
         self.db.conn.commit()
+        self.db.version += 1
 
 class DarkWebOSINT:
     """Dark web search using Ahmia and other Tor search engines"""
@@ -757,13 +1294,29 @@ class DarkWebOSINT:
             url = f"https://ahmia.fi/search/?q={quote(query)}"
             headers = {'User-Agent': 'Mozilla/5.0'}
 
-            response = requests.get(url, headers=headers, timeout=15)
-
-            if response.status_code == 200:
-                # Simple parsing - look for .onion links
-                onion_pattern = r'http[s]?://[a-z2-7]{16,56}\.onion[^\s<>"]*'
-                found_onions = list(set(re.findall(onion_pattern, response.text)))
+            with requests.get(url, headers=headers, timeout=15, stream=True) as response:
+                if response.status_code == 200:
+                    # Scan for .onion links chunk by chunk instead of
+                    # buffering the whole result page
+                    found = set()
+                    tail = ''
+                    for chunk in response.iter_content(chunk_size=65536, decode_unicode=True):
+                        if not chunk:
+                            continue
+                        buf = tail + chunk
+                        for match in _ONION_RE.finditer(buf):
+                            # A match touching the buffer end may continue
+                            # in the next chunk; the overlap re-scans it
+                            if match.end() < len(buf):
+                                found.add(match.group(0))
+                        tail = buf[-512:]
+                    found.update(match.group(0) for match in _ONION_RE.finditer(tail))
+                    found_onions = list(found)
+                else:
+                    found_onions = None
+                status_code = response.status_code
 
+            if found_onions is not None:
                 results['results'] = found_onions
                 results['count'] = len(found_onions)
 
@@ -776,7 +1329,7 @@ class DarkWebOSINT:
                     print(f"\n  {Colors.CYAN}... and {len(found_onions) - 10} more{Colors.END}")
 
             else:
-                print(f"{Colors.RED}[-] Search returned status {response.status_code}{Colors.END}")
+                print(f"{Colors.RED}[-] Search returned status {status_code}{Colors.END}")
 
         except Exception as e:
             print(f"{Colors.RED}[-] Error searching: {e}{Colors.END}")
@@ -806,75 +1359,71 @@ class DarkWebOSINT:
             data['query'],
             data['search_engine'],
             data['count'],
-            json.dumps(data)
+            _json_dumps(data)
         ))
         self.db.conn.commit()
+        self.db.version += 1
 
 class OSINTInternational:
     """Main OSINT tool"""
 
     def __init__(self):
         self.db = OSINTDatabase()
-        self.phone_osint = PhoneOSINT(self.db)
-        self.people_osint = PeopleOSINT(self.db)
-        self.domain_osint = DomainOSINT(self.db)
-        self.breach_osint = BreachDataOSINT(self.db)
-        self.image_osint = ReverseImageOSINT(self.db)
-        self.darkweb_osint = DarkWebOSINT(self.db)
+        # Rendered recent-search listing, reused until a new search lands
+        self._recent_cache = None
+        self._recent_cache_version = -1
+
+    # Submodules are built on first use so startup only pays for the
+    # database; each carries its own setup cost (HTTP session, DNS
+    # pre-warm thread, lazy library imports) that an unused module
+    # should not charge
+
+    @functools.cached_property
+    def phone_osint(self):
+        return PhoneOSINT(self.db)
+
+    @functools.cached_property
+    def people_osint(self):
+        return PeopleOSINT(self.db)
+
+    @functools.cached_property
+    def domain_osint(self):
+        return DomainOSINT(self.db)
+
+    @functools.cached_property
+    def breach_osint(self):
+        return BreachDataOSINT(self.db)
+
+    @functools.cached_property
+    def image_osint(self):
+        return ReverseImageOSINT(self.db)
+
+    @functools.cached_property
+    def darkweb_osint(self):
+        return DarkWebOSINT(self.db)
 
     def banner(self):
-        print(f"\n{Colors.BOLD}{Colors.CYAN}")
-        print("╔════════════════════════════════════════════╗")
-        print("║   INTERNATIONAL OSINT TOOL v2.0            ║")
-        print("║   Advanced Intelligence Gathering          ║")
-        print("║   Multi-Source OSINT Platform              ║")
-        print("╚════════════════════════════════════════════╝")
-        print(f"{Colors.END}\n")
+        sys.stdout.write(_BANNER_STR)
 
     def main_menu(self):
+        # Bind the loop's only per-iteration strings to locals once;
+        # everything else in the frame is pre-rendered at import
+        prompt = f"\n{Colors.CYAN}Select option:{Colors.END} "
+        write = sys.stdout.write
+
         while True:
-            print(f"\n{Colors.BOLD}Main Menu:{Colors.END}")
-            print(f"\n{Colors.CYAN}  Core Modules:{Colors.END}")
-            print(f"  {Colors.GREEN}1.{Colors.END} Phone Number Lookup")
-            print(f"  {Colors.GREEN}2.{Colors.END} Username/People Search")
-            print(f"  {Colors.GREEN}3.{Colors.END} Email Search")
-            print(f"\n{Colors.CYAN}  Advanced Modules:{Colors.END}")
-            print(f"  {Colors.GREEN}4.{Colors.END} Domain OSINT (WHOIS/DNS)")
-            print(f"  {Colors.GREEN}5.{Colors.END} Breach Data Check")
-            print(f"  {Colors.GREEN}6.{Colors.END} Reverse Image Search")
-            print(f"  {Colors.GREEN}7.{Colors.END} Dark Web Search")
-            print(f"\n{Colors.CYAN}  Utilities:{Colors.END}")
-            print(f"  {Colors.GREEN}8.{Colors.END} View Recent Searches")
-            print(f"  {Colors.GREEN}9.{Colors.END} Export Results")
-            print(f"  {Colors.GREEN}0.{Colors.END} Country Selection Guide")
-            print(f"  {Colors.GREEN}q.{Colors.END} Quit")
-
-            choice = input(f"\n{Colors.CYAN}Select option:{Colors.END} ").strip().lower()
+            write(_MAIN_MENU_STR)
 
-            if choice == '1':
-                self.phone_menu()
-            elif choice == '2':
-                self.username_menu()
-            elif choice == '3':
-                self.email_menu()
-            elif choice == '4':
-                self.domain_menu()
-            elif choice == '5':
-                self.breach_menu()
-            elif choice == '6':
-                self.image_menu()
-            elif choice == '7':
-                self.darkweb_menu()
-            elif choice == '8':
-                self.view_recent()
-            elif choice == '9':
-                self.export_results()
-            elif choice == '0':
-                self.country_guide()
-            elif choice == 'q':
+            choice = input(prompt).strip().lower()
+
+            if choice == 'q':
                 print(f"\n{Colors.GREEN}Goodbye!{Colors.END}\n")
                 break
 
+            handler = self._MENU_DISPATCH.get(choice)
+            if handler:
+                handler(self)
+
     def phone_menu(self):
         print(f"\n{Colors.BOLD}Phone Number Lookup{Colors.END}")
         print(f"{Colors.YELLOW}Format: +[country_code][number] (e.g., +44 7700 900000){Colors.END}")
@@ -944,7 +1493,7 @@ class OSINTInternational:
 
         if domain:
             # Remove http:// or https:// if present
-            domain = domain.replace('http://', '').replace('https://', '').split('/')[0]
+            domain = domain.removeprefix('https://').removeprefix('http://').partition('/')[0]
             self.domain_osint.lookup_domain(domain)
 
         input(f"\n{Colors.BLUE}Press Enter to continue...{Colors.END}")
@@ -993,20 +1542,45 @@ class OSINTInternational:
         input(f"\n{Colors.BLUE}Press Enter to continue...{Colors.END}")
 
     def view_recent(self):
-        print(f"\n{Colors.BOLD}Recent Searches{Colors.END}")
-        searches = self.db.get_recent_searches(20)
+        # Re-query and re-render only when something has been written to
+        # the database since the last visit
+        if self._recent_cache is None or self._recent_cache_version != self.db.version:
+            searches = self.db.get_recent_searches(20)
 
-        if not searches:
-            print(f"{Colors.YELLOW}No searches yet{Colors.END}")
-        else:
-            for s in searches:
-                print(f"\n{Colors.CYAN}{s['created_at']}{Colors.END}")
-                print(f"  Type: {s['search_type']}")
-                print(f"  Query: {s['query']}")
-                print(f"  Results: {s['results_count']}")
+            if not searches:
+                parts = [f"{Colors.YELLOW}No searches yet{Colors.END}\n"]
+            else:
+                parts = []
+                for s in searches:
+                    parts.append(f"\n{Colors.CYAN}{s['created_at']}{Colors.END}\n")
+                    parts.append(f"  Type: {s['search_type']}\n")
+                    parts.append(f"  Query: {s['query']}\n")
+                    parts.append(f"  Results: {s['results_count']}\n")
+
+            self._recent_cache = ''.join(parts)
+            self._recent_cache_version = self.db.version
+
+        print(f"\n{Colors.BOLD}Recent Searches{Colors.END}")
+        sys.stdout.write(self._recent_cache)
 
         input(f"\n{Colors.BLUE}Press Enter to continue...{Colors.END}")
 
+    def _export_rows_json(self, cursor, filepath):
+        """Stream query rows to a JSON array one row at a time"""
+        # Column names come from cursor.description once; each row then
+        # zips against the cached list instead of asking the Row for its
+        # keys (or round-tripping through the serializer default hook)
+        cols = [c[0] for c in cursor.description]
+        with open(filepath, 'w') as f:
+            f.write('[\n')
+            first = True
+            for row in cursor:
+                if not first:
+                    f.write(',\n')
+                first = False
+                f.write(_json_dumps_pretty(dict(zip(cols, row))))
+            f.write('\n]\n')
+
     def export_results(self):
         print(f"\n{Colors.BOLD}Export Results{Colors.END}")
         print(f"{Colors.YELLOW}Export options:{Colors.END}")
@@ -1021,22 +1595,18 @@ class OSINTInternational:
         if choice == '1':
             cursor = self.db.conn.cursor()
             cursor.execute("SELECT * FROM phone_lookups ORDER BY created_at DESC")
-            data = [dict(row) for row in cursor.fetchall()]
 
             filepath = RESULTS_DIR / f'phone_lookups_{timestamp}.json'
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            self._export_rows_json(cursor, filepath)
 
             print(f"{Colors.GREEN}[+] Exported to: {filepath}{Colors.END}")
 
         elif choice == '2':
             cursor = self.db.conn.cursor()
             cursor.execute("SELECT * FROM people_searches ORDER BY created_at DESC")
-            data = [dict(row) for row in cursor.fetchall()]
 
             filepath = RESULTS_DIR / f'username_searches_{timestamp}.json'
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            self._export_rows_json(cursor, filepath)
 
             print(f"{Colors.GREEN}[+] Exported to: {filepath}{Colors.END}")
 
@@ -1044,27 +1614,31 @@ class OSINTInternational:
             filepath = RESULTS_DIR / f'osint_report_{timestamp}.md'
 
             with open(filepath, 'w') as f:
-                f.write("# International OSINT Report\n\n")
-                f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-
-                # Phone lookups
-                f.write("## Phone Number Lookups\n\n")
+                # Sections are assembled as lists of fragments and flushed
+                # with one writelines call each rather than many tiny writes
+                parts = [
+                    "# International OSINT Report\n\n",
+                    f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+                    "## Phone Number Lookups\n\n",
+                ]
                 cursor = self.db.conn.cursor()
                 cursor.execute("SELECT * FROM phone_lookups ORDER BY created_at DESC LIMIT 50")
-                phones = cursor.fetchall()
-
-                for p in phones:
-                    f.write(f"### {p['phone_number']}\n")
-                    f.write(f"- **Valid:** {p['valid']}\n")
-                    f.write(f"- **Country:** {p['country']}\n")
-                    f.write(f"- **Carrier:** {p['carrier']}\n")
-                    f.write(f"- **Line Type:** {p['line_type']}\n")
-                    f.write(f"- **Location:** {p['location']}\n")
-                    f.write(f"- **Timezone:** {p['timezone']}\n")
-                    f.write(f"- **Date:** {p['created_at']}\n\n")
+
+                for p in cursor:
+                    parts.append(
+                        f"### {p['phone_number']}\n"
+                        f"- **Valid:** {p['valid']}\n"
+                        f"- **Country:** {p['country']}\n"
+                        f"- **Carrier:** {p['carrier']}\n"
+                        f"- **Line Type:** {p['line_type']}\n"
+                        f"- **Location:** {p['location']}\n"
+                        f"- **Timezone:** {p['timezone']}\n"
+                        f"- **Date:** {p['created_at']}\n\n"
+                    )
+                f.writelines(parts)
 
                 # Username searches
-                f.write("## Username Searches\n\n")
+                parts = ["## Username Searches\n\n"]
                 cursor.execute("""
                     SELECT username, COUNT(*) as total,
                            SUM(CASE WHEN found THEN 1 ELSE 0 END) as found_count
@@ -1074,70 +1648,34 @@ class OSINTInternational:
                 """)
                 usernames = cursor.fetchall()
 
-                for u in usernames:
-                    f.write(f"### {u['username']}\n")
-                    f.write(f"- **Found on:** {u['found_count']} / {u['total']} platforms\n\n")
+                # One query for all found profiles instead of one per
+                # username, grouped in a single pass over the sorted rows
+                cursor.execute("""
+                    SELECT username, platform, url FROM people_searches
+                    WHERE found = 1 ORDER BY username
+                """)
+                found_profiles = {
+                    name: [(r['platform'], r['url']) for r in rows]
+                    for name, rows in groupby(cursor, key=lambda r: r['username'])
+                }
 
-                    cursor.execute("""
-                        SELECT platform, url FROM people_searches
-                        WHERE username = ? AND found = 1
-                    """, (u['username'],))
+                for u in usernames:
+                    parts.append(f"### {u['username']}\n")
+                    parts.append(f"- **Found on:** {u['found_count']} / {u['total']} platforms\n\n")
 
-                    platforms = cursor.fetchall()
+                    platforms = found_profiles.get(u['username'])
                     if platforms:
-                        f.write("**Profiles found:**\n")
-                        for p in platforms:
-                            f.write(f"- [{p['platform']}]({p['url']})\n")
-                        f.write("\n")
+                        parts.append("**Profiles found:**\n")
+                        parts.extend(f"- [{platform}]({url})\n" for platform, url in platforms)
+                        parts.append("\n")
+                f.writelines(parts)
 
             print(f"{Colors.GREEN}[+] Exported report to: {filepath}{Colors.END}")
 
         input(f"\n{Colors.BLUE}Press Enter to continue...{Colors.END}")
 
     def country_guide(self):
-        print(f"\n{Colors.BOLD}Country Selection Guide{Colors.END}\n")
-
-        countries = {
-            'Europe': {
-                'GB': 'United Kingdom (+44)',
-                'DE': 'Germany (+49)',
-                'FR': 'France (+33)',
-                'IT': 'Italy (+39)',
-                'ES': 'Spain (+34)',
-                'RU': 'Russia (+7)',
-                'PL': 'Poland (+48)',
-                'UA': 'Ukraine (+380)',
-            },
-            'Asia': {
-                'CN': 'China (+86)',
-                'IN': 'India (+91)',
-                'JP': 'Japan (+81)',
-                'KR': 'South Korea (+82)',
-                'PK': 'Pakistan (+92)',
-                'ID': 'Indonesia (+62)',
-                'TH': 'Thailand (+66)',
-                'VN': 'Vietnam (+84)',
-            },
-            'Americas': {
-                'BR': 'Brazil (+55)',
-                'MX': 'Mexico (+52)',
-                'AR': 'Argentina (+54)',
-                'CO': 'Colombia (+57)',
-                'CA': 'Canada (+1)',
-            },
-            'Other': {
-                'AU': 'Australia (+61)',
-                'ZA': 'South Africa (+27)',
-                'EG': 'Egypt (+20)',
-                'SA': 'Saudi Arabia (+966)',
-            }
-        }
-
-        for region, codes in countries.items():
-            print(f"{Colors.CYAN}{region}:{Colors.END}")
-            for code, name in codes.items():
-                print(f"  {Colors.GREEN}{code}{Colors.END} - {name}")
-            print()
+        sys.stdout.write(_COUNTRY_GUIDE_STR)
 
         input(f"{Colors.BLUE}Press Enter to continue...{Colors.END}")
 
@@ -1145,6 +1683,22 @@ class OSINTInternational:
         self.banner()
         self.main_menu()
 
+    # Menu choices dispatch through a single dict lookup instead of the
+    # former if/elif ladder; defined after the handlers so the table
+    # holds the functions directly
+    _MENU_DISPATCH = {
+        '1': phone_menu,
+        '2': username_menu,
+        '3': email_menu,
+        '4': domain_menu,
+        '5': breach_menu,
+        '6': image_menu,
+        '7': darkweb_menu,
+        '8': view_recent,
+        '9': export_results,
+        '0': country_guide,
+    }
+
 if __name__ == '__main__':
     try:
         tool = OSINTInternational()